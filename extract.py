@@ -1,24 +1,67 @@
 
+import hashlib
 import os
+import pickle
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 
 import argparse
 import pandas as pd
 import pdfplumber
 
+try:
+    import pypdfium2 as pdfium  # used with --fast-text / FAST_TEXT
+except ImportError:
+    pdfium = None
+
+try:
+    import hyperscan  # optional: single-pass Seq + GN scan of each page
+except ImportError:
+    hyperscan = None
+
+try:
+    import xlsxwriter  # optional: faster, low-memory Excel output
+except ImportError:
+    xlsxwriter = None
+
 # -----------------------------
 # Configuration
 # -----------------------------
 SCRIPT_DIR = Path(__file__).resolve().parent
 INPUT_DIR = SCRIPT_DIR / "input_pdfs"   # folder containing PDFs next to the script
 OUTPUT_XLSX = SCRIPT_DIR / "Pledges_Output.xlsx"
+OUTPUT_PARQUET = SCRIPT_DIR / "Pledges_Output.parquet"  # used with --parquet
 
 # Defaults: set to True if desired
 DEFAULT_PLEDGE_EQUALS_PAYMENT = True
 DEFAULT_PERCENTAGE_100 = True
 
+# Parallelism: number of worker processes used to parse PDFs.
+# None -> use all cores but one (see _get_max_workers).
+MAX_WORKERS: Optional[int] = None
+
+# Pages per task when a single PDF is split across worker processes.
+PAGE_BLOCK_SIZE = 8
+
+# Text backend: False -> pdfplumber extract_text() (layout-sorted lines, the default).
+# True (or --fast-text) -> pypdfium2 raw text: much faster, but text comes out in
+# content-stream order, so check the rows against a pdfplumber run before relying on it.
+FAST_TEXT = False
+
+# Pages per pdfplumber open() (bounds memory on very large files).
+PDFPLUMBER_SLICE_SIZE = 32
+
+# On-disk cache of extracted rows per PDF, keyed by file name + content, the
+# DEFAULT_* settings above and the text backend (see _cache_path_for).
+# Bump CACHE_VERSION whenever extraction logic changes so old entries are ignored.
+CACHE_DIR = SCRIPT_DIR / ".cache"
+CACHE_VERSION = 1
+
 # Optional lookup file to backfill account numbers:
 # Excel with two columns: fullName, INDACCOUNTNUMBER
 ACCOUNT_LOOKUP_CSV = SCRIPT_DIR / "donor_names_accounts.csv"  # set to None if not using
@@ -44,18 +87,32 @@ TARGET_COLUMNS = [
 # Regex patterns
 # -----------------------------
 # Example line: 5250031143286 JAMES ROBERT BOYD 2727 Check 100.00 4600055
+# Scanned once over a whole page (see _INLINE_WS_RE): separators are spaces only,
+# and "." never crosses a newline, so every match stays within a single line.
 LINE_PATTERN = re.compile(
     r"""
-    (?P<Seq>\d{13})\s+                       # Seq (13 digits)
-    (?P<Name>.*?)\s+                         # Name (non-greedy up to next numeric token)
-    (?P<CheckNumber>\d{1,10})\s+             # Check number
-    (?P<PaymentType>Check|Cash|Card|ACH)\s+  # Payment type
-    (?P<Amount>\d+(?:\.\d{2}))\s+            # Amount
+    (?P<Seq>\d{13})[ ]+                      # Seq (13 digits)
+    (?P<Name>.*?)[ ]+                        # Name (non-greedy up to next numeric token)
+    (?P<CheckNumber>\d{1,10})[ ]+            # Check number
+    (?P<PaymentType>Check|Cash|Card|ACH)[ ]+ # Payment type
+    (?P<Amount>\d+(?:\.\d{2}))[ ]+           # Amount
     (?P<BatchNumber>\d+)                     # Batch number (ignored after capture)
     """,
     re.VERBOSE,
 )
 
+# Cheap precheck: a transaction line starts with a 13-digit Seq followed by a space.
+# LINE_PATTERN is only tried at positions where this matches.
+_SEQ13_PREFIX_RE = re.compile(r"\d{13} ")
+
+# Runs of whitespace other than newlines; collapsed to one space per page before scanning
+_INLINE_WS_RE = re.compile(r"[^\S\n]+")
+
+# Used by the --debug output for unmatched pages
+_WS_RE = re.compile(r"\s+")
+_AMOUNT_RE = re.compile(r"\d+\.\d{2}")
+_SEQ13_RE = re.compile(r"\d{13}")
+
 # GN label can appear as "GN1", "GN-2", "GN 3"
 GN_PATTERN = re.compile(
     r"""
@@ -64,6 +121,31 @@ GN_PATTERN = re.compile(
     re.IGNORECASE | re.VERBOSE,
 )
 
+# Bound methods for the per-match hot path (saves an attribute lookup per call)
+_find_seq_prefixes = _SEQ13_PREFIX_RE.finditer
+_match_line = LINE_PATTERN.match
+_search_gn = GN_PATTERN.search
+
+# Hyperscan block database: Seq candidates (same as _SEQ13_PREFIX_RE) and GN labels.
+# Pages are whitespace-normalized first, so \s only ever sees " " and "\n" here.
+_HS_SEQ_ID = 0
+_HS_GN_ID = 1
+_HS_SEQ_LEN = 14  # 13 digits + space
+
+
+def _build_hs_database():
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(
+        expressions=[rb"\d{13} ", rb"\bGN\s*[- ]?[1-7]\b"],
+        ids=[_HS_SEQ_ID, _HS_GN_ID],
+        elements=2,
+        flags=[0, hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH],
+    )
+    return db
+
+
+_HS_DB = _build_hs_database() if hyperscan is not None else None
+
 
 # -----------------------------
 # Helpers
@@ -73,90 +155,282 @@ def detect_gn_label_on_page(text: str) -> Optional[str]:
     Detect GN label (GN1–GN7) from a text snippet (line or nearby context).
     Returns 'GN#' or None.
     """
-    m = GN_PATTERN.search(text or "")
+    m = _search_gn(text or "")
     return f"GN{m.group('gn')}" if m else None
 
 
-def normalize_name_for_lookup(name: str) -> str:
+def iter_line_matches(page_text: str, candidates: Optional[Iterable[int]] = None) -> Iterator[re.Match]:
+    """
+    Same matches as LINE_PATTERN.finditer(page_text), but the full pattern is only
+    run where a candidate Seq starts (headers, totals, footers are skipped).
+    Candidates are found with _SEQ13_PREFIX_RE unless given (sorted start offsets).
+    """
+    if candidates is None:
+        candidates = (cand.start() for cand in _find_seq_prefixes(page_text))
+    pos = 0
+    for start in candidates:
+        if start < pos:
+            continue  # inside the previous match
+        m = _match_line(page_text, start)
+        if m:
+            pos = m.end()
+            yield m
+
+
+def _hs_scan(page_text: str) -> Tuple[List[int], bool]:
+    """
+    One hyperscan pass over an ASCII page: (Seq candidate starts, page has a GN label).
+    """
+    seq_starts: List[int] = []
+    gn_hits: List[int] = []
+
+    def on_match(match_id, start, end, flags, context):
+        if match_id == _HS_SEQ_ID:
+            seq_starts.append(end - _HS_SEQ_LEN)
+        else:
+            gn_hits.append(end)
+
+    _HS_DB.scan(page_text.encode("ascii"), match_event_handler=on_match)
+    seq_starts.sort()
+    return seq_starts, bool(gn_hits)
+
+
+def scan_page(page_text: str) -> Tuple[Iterator[re.Match], bool]:
     """
-    Normalize name to abbreviated form: first initial + last name.
+    Return (transaction line matches, whether the page has any GN label).
+    Uses hyperscan for both in a single pass when installed; hyperscan offsets are
+    byte offsets, so pages with non-ASCII text go through the re path instead.
+    """
+    if _HS_DB is not None and page_text.isascii():
+        seq_starts, page_has_gn = _hs_scan(page_text)
+        return iter_line_matches(page_text, seq_starts), page_has_gn
+    return iter_line_matches(page_text), detect_gn_label_on_page(page_text) is not None
+
+
+def normalize_name_for_lookup(names: pd.Series) -> pd.Series:
+    """
+    Normalize names to abbreviated form: first initial + last name.
     E.g., "FREDERICK B HUSSEY" -> "F HUSSEY"
+    Single-word names are kept as-is (upper-cased, stripped).
     """
-    parts = name.upper().strip().split()
-    if len(parts) >= 2:
-        return parts[0][0] + " " + parts[-1]
-    else:
-        return name.upper().strip()
+    cleaned = names.str.upper().str.strip()
+    parts = cleaned.str.split()
+    abbreviated = parts.str[0].str[0] + " " + parts.str[-1]
+    return abbreviated.where(parts.str.len() >= 2, cleaned)
 
 
-def extract_rows_from_pdf(pdf_path: Path, debug: bool = False) -> List[Dict[str, str]]:
-    rows: List[Dict[str, str]] = []
+def _get_max_workers(n_tasks: int) -> int:
+    """
+    Number of worker processes to use: MAX_WORKERS if set, otherwise
+    all cores but one (leave headroom), never more than there are tasks.
+    """
+    workers = MAX_WORKERS or max(1, (os.cpu_count() or 1) - 1)
+    return max(1, min(workers, n_tasks))
 
+
+def _count_pages(pdf_path: Path, fast_text: bool = False) -> int:
+    if fast_text:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
     with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, start=1):
-            # Get text; if your PDFs are scans, text may be empty (OCR needed).
-            text = page.extract_text() or ""
-            lines = text.splitlines()
-
-            matched_any = False
-            for ln_num, line in enumerate(lines, start=1):
-                # Normalize whitespace per line
-                line_flat = re.sub(r"\s+", " ", line).strip()
-                for m in LINE_PATTERN.finditer(line_flat):
-                    matched_any = True
-                    seq = m.group("Seq").strip()
-                    name = m.group("Name").strip()
-                    check_no = m.group("CheckNumber").strip()
-                    pay_type = m.group("PaymentType").strip()
-                    amt_str = m.group("Amount").strip()
-
-                    payment = float(amt_str)
-                    pledge = payment if DEFAULT_PLEDGE_EQUALS_PAYMENT else None
-                    percent = 100 if DEFAULT_PERCENTAGE_100 else None
-
-                    # Detect GN only within the same line (use detector result, default to GN1)
-                    line_GNF_label = detect_gn_label_on_page(line_flat) or "GN1"
-
-                    row = {
-                        "Individuals.ACCOUNTNUMBER": "",  # filled via lookup if provided
-                        "Individuals.fullName": name,     # name from PDF
-                        "Individuals.Transactions.TOTALPLEDGEAMOUNT": pledge,
-                        "Individuals.Transactions.TOTALPAYMENTAMOUNT": payment,
-                        "Individuals.Transactions.PAYMENTTYPE": pay_type,
-                        "Individuals.Transactions.CHECKNUMBER": check_no,
-                        "Individuals.Transactions.DCDetails.BOOKLABEL": line_GNF_label,
-                        "Individuals.Transactions.DCDetails.DESPERCENTAGE": percent,
-                        "Source File": pdf_path.name,
-                        "Seq": seq,
-                        # lookup columns start empty
-                        "Account.fullName": "",
-                        "Account.INDACCOUNTNUMBER": "",
-                    }
-                    rows.append(row)
-
-            if not matched_any:
-                print(f"[WARN] No transaction lines matched on {pdf_path.name} (page {page_num}).")
-                if debug:
-                    print("[DEBUG] Page text snippet (first 300 chars):")
-                    page_text_flat = re.sub(r"\s+", " ", text).strip()
-                    print(page_text_flat[:300])
-                    amount_pat = re.compile(r"\d+\.\d{2}")
-                    seq13_pat = re.compile(r"\d{13}")
-                    amounts = list(amount_pat.finditer(page_text_flat))
-                    seqs = list(seq13_pat.finditer(page_text_flat))
-                    print(f"[DEBUG] Found {len(amounts)} amount-like tokens and {len(seqs)} 13-digit sequences on page {page_num}.")
-                    if amounts:
-                        print("[DEBUG] Amount contexts:")
-                        for a in amounts[:10]:
-                            start = max(0, a.start() - 50)
-                            end = min(len(page_text_flat), a.end() + 50)
-                            print(f"...{page_text_flat[start:end]}...")
-                    if seqs:
-                        print("[DEBUG] 13-digit seqs (first 10):")
-                        for s in seqs[:10]:
-                            start = max(0, s.start() - 20)
-                            end = min(len(page_text_flat), s.end() + 20)
-                            print(f"...{page_text_flat[start:end]}...")
+        return len(pdf.pages)
+
+
+def _iter_raw_page_texts(pdf_path: Path, page_indices: Optional[List[int]] = None, fast_text: bool = False) -> Iterator[str]:
+    """
+    Yield the text of the requested pages (0-based indices; all pages if None).
+    Uses pdfplumber, or pypdfium2 raw text (no layout objects) when fast_text is set.
+    If your PDFs are scans, text may be empty (OCR needed).
+    """
+    if fast_text:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            for i in range(len(pdf)) if page_indices is None else page_indices:
+                page = pdf[i]
+                textpage = page.get_textpage()
+                yield textpage.get_text_range()
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return
+
+    if page_indices is None:
+        page_indices = list(range(_count_pages(pdf_path, fast_text)))
+    # pdfplumber holds on to every page it has loaded until the PDF is closed,
+    # so reopen it per slice of pages to keep memory bounded on very large files
+    for i in range(0, len(page_indices), PDFPLUMBER_SLICE_SIZE):
+        pages = [idx + 1 for idx in page_indices[i:i + PDFPLUMBER_SLICE_SIZE]]
+        with pdfplumber.open(pdf_path, pages=pages) as pdf:
+            for page in pdf.pages:
+                text = page.extract_text() or ""
+                # Drop pdfplumber's cached layout objects before moving on
+                page.flush_cache()
+                yield text
+
+
+def _extract_page_texts(pdf_path: Path, page_indices: List[int], fast_text: bool = False) -> List[str]:
+    """
+    Worker: open only the requested pages (0-based indices) and return their text.
+    """
+    return list(_iter_raw_page_texts(pdf_path, page_indices, fast_text))
+
+
+def iter_page_texts(pdf_path: Path, page_workers: int = 1, fast_text: bool = False) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (page_num, text) for every page of the PDF, in page order.
+    With page_workers > 1, blocks of PAGE_BLOCK_SIZE pages are extracted in parallel.
+    """
+    n_pages = _count_pages(pdf_path, fast_text) if page_workers > 1 else 0
+    if n_pages <= PAGE_BLOCK_SIZE:
+        yield from enumerate(_iter_raw_page_texts(pdf_path, fast_text=fast_text), start=1)
+        return
+
+    blocks = [list(range(i, min(i + PAGE_BLOCK_SIZE, n_pages))) for i in range(0, n_pages, PAGE_BLOCK_SIZE)]
+    remaining = iter(blocks)
+    with ProcessPoolExecutor(max_workers=min(page_workers, len(blocks))) as executor:
+        # Keep only a small window of blocks in flight so finished page text
+        # does not pile up in memory faster than it is consumed
+        pending = deque(executor.submit(_extract_page_texts, pdf_path, block, fast_text)
+                        for block in islice(remaining, page_workers * 2))
+        page_num = 0
+        while pending:
+            texts = pending.popleft().result()
+            next_block = next(remaining, None)
+            if next_block is not None:
+                pending.append(executor.submit(_extract_page_texts, pdf_path, next_block, fast_text))
+            for text in texts:
+                page_num += 1
+                yield page_num, text
+
+
+def extract_rows_from_pdf(pdf_path: Path, debug: bool = False, page_workers: int = 1, fast_text: bool = False) -> List[Dict[str, str]]:
+    rows: List[Dict[str, str]] = []
+    empty_pages = 0
+    # Seq is unique per transaction, so (Source File, Seq) identifies a row; within one PDF that is just Seq
+    seen_seqs = set()
+
+    for page_num, text in iter_page_texts(pdf_path, page_workers, fast_text):
+        # Scanned (image-only) pages have no text layer: nothing to match, skip them quietly
+        if not text or text.isspace():
+            empty_pages += 1
+            continue
+
+        # Normalize whitespace once per page (newlines kept as line boundaries)
+        page_text = _INLINE_WS_RE.sub(" ", text)
+        # GN is searched once per page: if the page has no GN label, no line on it can have one
+        line_matches, page_has_gn = scan_page(page_text)
+
+        matched_any = False
+        for m in line_matches:
+            matched_any = True
+            seq = m.group("Seq").strip()
+            if seq in seen_seqs:
+                continue  # same transaction printed again (e.g. repeated on a later page)
+            seen_seqs.add(seq)
+            name = m.group("Name").strip()
+            check_no = m.group("CheckNumber").strip()
+            pay_type = m.group("PaymentType").strip()
+            amt_str = m.group("Amount").strip()
+
+            payment = float(amt_str)
+            pledge = payment if DEFAULT_PLEDGE_EQUALS_PAYMENT else None
+            percent = 100 if DEFAULT_PERCENTAGE_100 else None
+
+            # Detect GN only within the same line (use detector result, default to GN1)
+            line_GNF_label = "GN1"
+            if page_has_gn:
+                line_start = page_text.rfind("\n", 0, m.start()) + 1
+                line_end = page_text.find("\n", m.end())
+                line_flat = page_text[line_start:line_end if line_end != -1 else len(page_text)]
+                line_GNF_label = detect_gn_label_on_page(line_flat) or "GN1"
+
+            row = {
+                "Individuals.ACCOUNTNUMBER": "",  # filled via lookup if provided
+                "Individuals.fullName": name,     # name from PDF
+                "Individuals.Transactions.TOTALPLEDGEAMOUNT": pledge,
+                "Individuals.Transactions.TOTALPAYMENTAMOUNT": payment,
+                "Individuals.Transactions.PAYMENTTYPE": pay_type,
+                "Individuals.Transactions.CHECKNUMBER": check_no,
+                "Individuals.Transactions.DCDetails.BOOKLABEL": line_GNF_label,
+                "Individuals.Transactions.DCDetails.DESPERCENTAGE": percent,
+                "Source File": pdf_path.name,
+                "Seq": seq,
+                # lookup columns start empty
+                "Account.fullName": "",
+                "Account.INDACCOUNTNUMBER": "",
+            }
+            rows.append(row)
+
+        if not matched_any:
+            print(f"[WARN] No transaction lines matched on {pdf_path.name} (page {page_num}).")
+            if debug:
+                print("[DEBUG] Page text snippet (first 300 chars):")
+                page_text_flat = _WS_RE.sub(" ", text).strip()
+                print(page_text_flat[:300])
+                amounts = list(_AMOUNT_RE.finditer(page_text_flat))
+                seqs = list(_SEQ13_RE.finditer(page_text_flat))
+                print(f"[DEBUG] Found {len(amounts)} amount-like tokens and {len(seqs)} 13-digit sequences on page {page_num}.")
+                if amounts:
+                    print("[DEBUG] Amount contexts:")
+                    for a in amounts[:10]:
+                        start = max(0, a.start() - 50)
+                        end = min(len(page_text_flat), a.end() + 50)
+                        print(f"...{page_text_flat[start:end]}...")
+                if seqs:
+                    print("[DEBUG] 13-digit seqs (first 10):")
+                    for s in seqs[:10]:
+                        start = max(0, s.start() - 20)
+                        end = min(len(page_text_flat), s.end() + 20)
+                        print(f"...{page_text_flat[start:end]}...")
+
+    if empty_pages:
+        print(f"[INFO] {pdf_path.name}: skipped {empty_pages} page(s) with no text (scanned? OCR needed).")
+    return rows
+
+
+def _cache_path_for(pdf_path: Path, fast_text: bool = False) -> Path:
+    # Everything that changes the extracted rows must be part of the key
+    settings = (
+        f"v{CACHE_VERSION}:{pdf_path.name}:"
+        f"pledge={DEFAULT_PLEDGE_EQUALS_PAYMENT}:percent={DEFAULT_PERCENTAGE_100}:"
+        f"backend={'pypdfium2' if fast_text else 'pdfplumber'}:"
+    )
+    h = hashlib.blake2b(settings.encode(), digest_size=16)
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return CACHE_DIR / f"{h.hexdigest()}.pkl"
+
+
+def extract_rows_cached(pdf_path: Path, debug: bool = False, page_workers: int = 1, fast_text: bool = False) -> List[Dict[str, str]]:
+    """
+    extract_rows_from_pdf with an on-disk cache: unchanged PDFs are not parsed again.
+    Debug runs always re-extract so their diagnostics are printed.
+    """
+    if debug:
+        return extract_rows_from_pdf(pdf_path, debug=debug, page_workers=page_workers, fast_text=fast_text)
+
+    cache_path = _cache_path_for(pdf_path, fast_text)
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                rows = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass  # unreadable entry: re-extract and overwrite it
+        else:
+            print(f"[INFO] {pdf_path.name}: rows loaded from cache (page warnings not repeated; use --no-cache to re-extract).")
+            return rows
+
+    rows = extract_rows_from_pdf(pdf_path, page_workers=page_workers, fast_text=fast_text)
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(cache_path)
     return rows
 
 
@@ -180,8 +454,16 @@ def load_account_lookup(path: Optional[Path]) -> Optional[pd.DataFrame]:
 
         # Create abbreviated key: first initial + last name
         df["abbrev_key"] = df["INDFIRSTNAME"].astype(str).str[0].str.upper() + " " + df["INDLASTNAME"].astype(str).str.upper().str.strip()
-        # Keep keys + fullName + INDACCOUNTNUMBER for later
-        return df[["abbrev_key", "fullName", "INDACCOUNTNUMBER"]].drop_duplicates(subset="abbrev_key")
+        # Different accounts sharing a key (e.g. two "J SMITH") cannot be told apart; the first one wins
+        accounts_per_key = df.groupby("abbrev_key")["INDACCOUNTNUMBER"].nunique()
+        ambiguous = accounts_per_key[accounts_per_key > 1]
+        if not ambiguous.empty:
+            print(f"[WARN] {len(ambiguous)} lookup key(s) map to more than one INDACCOUNTNUMBER; using the first row for each.")
+            print(f"[WARN] Ambiguous keys (first 10): {ambiguous.index[:10].tolist()}")
+
+        # Keep fullName + INDACCOUNTNUMBER indexed by key (one row per key) for later
+        lookup_df = df[["abbrev_key", "fullName", "INDACCOUNTNUMBER"]].drop_duplicates(subset="abbrev_key")
+        return lookup_df.set_index("abbrev_key")
 
     if path:
         print(f"[WARN] Lookup file {path} not found.")
@@ -198,38 +480,96 @@ def apply_account_lookup(df: pd.DataFrame, lookup_df: Optional[pd.DataFrame]) ->
         return df
 
     # Build join key in main df from the PDF name
-    df["abbrev_key"] = df["Individuals.fullName"].apply(normalize_name_for_lookup)
+    abbrev_key = normalize_name_for_lookup(df["Individuals.fullName"])
 
-    before_empty = df["Individuals.ACCOUNTNUMBER"].eq("").sum()
+    # Many-to-one lookup against the unique abbrev_key index; no merge, rows cannot multiply
+    matched_acct = abbrev_key.map(lookup_df["INDACCOUNTNUMBER"])
+    matched_name = abbrev_key.map(lookup_df["fullName"])
 
-    # Merge lookup on abbrev_key
-    df = df.merge(lookup_df, on="abbrev_key", how="left")
+    before_empty = df["Individuals.ACCOUNTNUMBER"].eq("").sum()
 
     # Fill Individuals.ACCOUNTNUMBER where currently empty and we have a match
-    mask_condition = df["Individuals.ACCOUNTNUMBER"].eq("") & df["INDACCOUNTNUMBER"].notna()
-    df["Individuals.ACCOUNTNUMBER"] = df["Individuals.ACCOUNTNUMBER"].mask(mask_condition, df["INDACCOUNTNUMBER"])
+    mask_condition = df["Individuals.ACCOUNTNUMBER"].eq("") & matched_acct.notna()
+    df["Individuals.ACCOUNTNUMBER"] = df["Individuals.ACCOUNTNUMBER"].mask(mask_condition, matched_acct)
 
     after_empty = df["Individuals.ACCOUNTNUMBER"].eq("").sum()
     filled = before_empty - after_empty
     print(f"[INFO] Account lookup filled {filled} ACCOUNTNUMBER values.")
 
     # Copy lookup data into the dedicated output columns
-    df["Account.fullName"] = df["fullName"].fillna("")
-    df["Account.INDACCOUNTNUMBER"] = df["INDACCOUNTNUMBER"].fillna("")
-
-    # Drop helper columns from join
-    df = df.drop(columns=["abbrev_key", "fullName", "INDACCOUNTNUMBER"])
+    df["Account.fullName"] = matched_name.fillna("")
+    df["Account.INDACCOUNTNUMBER"] = matched_acct.fillna("")
     return df
 
 
+def _cell_text(value) -> str:
+    """
+    Text form of a cell: "" for missing values, whole-number floats without ".0"
+    (account numbers come back from the lookup as floats, e.g. 4600055.0 -> "4600055").
+    """
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """
+    Save df as Parquet (needs pyarrow).
+
+    After the lookup the account columns mix "" with float account numbers, which
+    pyarrow cannot store in a single column, so object columns are written as text.
+    """
+    out = df.copy()
+    for col in out.columns[out.dtypes == object]:
+        out[col] = out[col].map(_cell_text).astype("string")
+    out.to_parquet(path, index=False)
+
+
+def write_excel(df: pd.DataFrame, path: Path) -> None:
+    """
+    Save df to the "Extracted" sheet.
+
+    With xlsxwriter installed, rows are streamed to disk in constant_memory mode.
+    (df.to_excel writes column by column, which constant_memory cannot handle,
+    so rows are written here directly.) Otherwise falls back to pandas + openpyxl.
+    """
+    if xlsxwriter is None:
+        with pd.ExcelWriter(path, engine="openpyxl") as writer:
+            df.to_excel(writer, index=False, sheet_name="Extracted")
+        return
+
+    workbook = xlsxwriter.Workbook(
+        str(path),
+        {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False},
+    )
+    worksheet = workbook.add_worksheet("Extracted")
+    header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    worksheet.write_row(0, 0, df.columns.tolist(), header_format)
+
+    # NaN -> None so missing values are left as blank cells
+    values = df.astype(object).where(df.notna(), None)
+    for row_num, row in enumerate(values.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_num, 0, row)
+    workbook.close()
+
+
 # -----------------------------
 # Main
 # -----------------------------
 def main():
     parser = argparse.ArgumentParser(description="Extract pledges from PDFs")
     parser.add_argument("--debug", action="store_true", help="Print debug information for unmatched pages")
+    parser.add_argument("--fast-text", action="store_true", help="Extract raw text with pypdfium2 (faster; line order may differ from pdfplumber)")
+    parser.add_argument("--no-cache", action="store_true", help=f"Re-extract every PDF, ignoring {CACHE_DIR.name}/")
+    parser.add_argument("--parquet", action="store_true", help=f"Write {OUTPUT_PARQUET.name} instead of Excel (much faster; needs pyarrow)")
     args = parser.parse_args()
 
+    fast_text = FAST_TEXT or args.fast_text
+    if fast_text and pdfium is None:
+        parser.error("--fast-text / FAST_TEXT needs pypdfium2 (pip install pypdfium2)")
+
     INPUT_DIR.mkdir(exist_ok=True)
     pdf_files = sorted(p for p in INPUT_DIR.glob("*.pdf"))
 
@@ -240,26 +580,32 @@ def main():
 
     all_rows: List[Dict[str, str]] = []
 
-    # Process every PDF in the input folder
-    for pdf_path in pdf_files:
-        rows = extract_rows_from_pdf(pdf_path, debug=args.debug)
-        all_rows.extend(rows)
-        print(f"[OK] {pdf_path.name}: extracted {len(rows)} rows")
+    # Process every PDF in the input folder (one process per PDF; map keeps input order).
+    # Cores not needed at the PDF level (e.g. a single large PDF) are used to split pages.
+    pdf_workers = _get_max_workers(len(pdf_files))
+    page_workers = max(1, _get_max_workers(os.cpu_count() or 1) // pdf_workers)
+    extract = extract_rows_from_pdf if args.no_cache else extract_rows_cached
+    worker = partial(extract, debug=args.debug, page_workers=page_workers, fast_text=fast_text)
+    with ProcessPoolExecutor(max_workers=pdf_workers) as executor:
+        for pdf_path, rows in zip(pdf_files, executor.map(worker, pdf_files)):
+            all_rows.extend(rows)
+            print(f"[OK] {pdf_path.name}: extracted {len(rows)} rows")
 
     if not all_rows:
         print("[ERROR] No rows extracted from any PDF. Check regex and sample text.")
         return
 
-    # Build DataFrame with your target columns
-    df = pd.DataFrame([{c: r.get(c, "") for c in TARGET_COLUMNS} for r in all_rows])
+    # Build DataFrame with your target columns (every row dict carries all TARGET_COLUMNS)
+    df = pd.DataFrame.from_records(all_rows, columns=TARGET_COLUMNS)
 
-    # Coerce numeric types where appropriate
+    # Coerce numeric types where appropriate. Rows already carry float/int values,
+    # so this only does work when a column fell back to object (e.g. all None).
     for col in [
         "Individuals.Transactions.TOTALPLEDGEAMOUNT",
         "Individuals.Transactions.TOTALPAYMENTAMOUNT",
         "Individuals.Transactions.DCDetails.DESPERCENTAGE",
     ]:
-        if col in df.columns:
+        if col in df.columns and df[col].dtype == object:
             df[col] = pd.to_numeric(df[col], errors="coerce")
 
     # Optional account number lookup
@@ -274,13 +620,13 @@ def main():
     print("[INFO] Sample of names + accounts after lookup:")
     print(df[["Individuals.fullName", "Individuals.ACCOUNTNUMBER", "Account.fullName", "Account.INDACCOUNTNUMBER"]].head(10))
 
-    # Remove any duplicate rows
-    df = df.drop_duplicates()
-
-    # Save to Excel
-    with pd.ExcelWriter(OUTPUT_XLSX, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Extracted")
-    print(f"[DONE] Saved {len(df)} rows to {OUTPUT_XLSX}")
+    # Save to Excel (or Parquet)
+    output_path = OUTPUT_PARQUET if args.parquet else OUTPUT_XLSX
+    if args.parquet:
+        write_parquet(df, output_path)
+    else:
+        write_excel(df, output_path)
+    print(f"[DONE] Saved {len(df)} rows to {output_path}")
 
 
 if __name__ == "__main__":